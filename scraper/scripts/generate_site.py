@@ -7,7 +7,6 @@ import logging
 import argparse
 from pathlib import Path
 from datetime import datetime
-from collections import Counter
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -72,121 +71,22 @@ def main():
         stats = db.get_statistics()
         logger.info(f"Database contains {stats['total_measures']} measures")
         
-        # Check if generation is needed
-        output_path = Path(args.output)
-        if output_path.exists() and not args.force:
-            # Check if database was updated after website
-            db_mtime = DB_PATH.stat().st_mtime
-            site_mtime = output_path.stat().st_mtime
-            
-            if db_mtime <= site_mtime:
-                logger.info("Website is up to date. Use --force to regenerate.")
-                return 0
-        
-        # Get all measures from database
-        logger.info("Loading measures from database...")
-        
-        # Valid BallotMeasure fields
-        valid_fields = {
-            'fingerprint', 'measure_fingerprint', 'content_hash',
-            'measure_id', 'measure_letter', 'year', 'state', 'county', 'jurisdiction',
-            'title', 'description', 'ballot_question',
-            'yes_votes', 'no_votes', 'total_votes', 'percent_yes', 'percent_no',
-            'passed', 'pass_fail',
-            'measure_type', 'topic_primary', 'topic_secondary', 'category_type', 'category_topic',
-            'data_source', 'source_url', 'pdf_url',
-            'has_summary', 'summary_title', 'summary_text',
-            'election_type', 'election_date', 'decade', 'century',
-            'created_at', 'updated_at', 'last_seen_at', 'update_count',
-            'is_active', 'is_duplicate', 'duplicate_type', 'master_id', 'merged_from'
-        }
-        
-        # Get measures and handle field issues
-        conn = db.connect()
-        cursor = conn.execute("""
-            SELECT * FROM active_measures
-            ORDER BY year DESC, county, measure_letter
-        """)
-        
-        measures = []
-        measures_data = []
-        for row in cursor:
-            # Convert row to dict
-            measure_dict = dict(row)
-            
-            # Store original dict for website
-            measures_data.append(measure_dict.copy())
-            
-            # Filter to only valid fields for BallotMeasure
-            filtered_dict = {k: v for k, v in measure_dict.items() if k in valid_fields}
-            
-            # Ensure required fields exist
-            filtered_dict.setdefault('fingerprint', '')
-            filtered_dict.setdefault('measure_fingerprint', '')
-            filtered_dict.setdefault('content_hash', '')
-            
-            from src.database.models import BallotMeasure
-            measure = BallotMeasure(**filtered_dict)
-            measures.append(measure)
-        
-        logger.info(f"Loaded {len(measures)} measures")
-        
-        # Close database connection
-        db.close()
-        
-        # Initialize website generator  
+        # Generate and save website (page plus measures.ndjson, also copied
+        # to the root directory for GitHub Pages); skipped when the inputs
+        # are unchanged since the last run unless --force is given
         from src.website.generator import WebsiteGenerator
-        generator = WebsiteGenerator()
-        
-        # Prepare data for website
-        # Convert measures to format needed by generator
-        measures_for_website = []
-        for m in measures:
-            m_dict = m.to_dict()
-            # Add display fields
-            m_dict['measure_text'] = m_dict.get('title') or m_dict.get('ballot_question', 'Unknown Measure')
-            m_dict['source'] = m_dict.get('data_source', 'Historical')
-            measures_for_website.append(m_dict)
-        
-        # Extract topics
-        from collections import Counter
-        topic_counts = Counter()
-        for measure in measures:
-            topic = measure.topic_primary or measure.category_topic
-            if topic:
-                topic_counts[topic] += 1
-        
-        topics = [
-            {'topic': topic, 'count': count}
-            for topic, count in topic_counts.most_common(20)
-        ]
-        
-        # Generate website
-        logger.info(f"Generating website...")
-        html_content = generator._generate_html(measures_for_website, stats, topics)
-        
-        # Save website
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html_content, encoding='utf-8')
+        generator = WebsiteGenerator(db, Path(args.output))
+        output_path = generator.generate(force=args.force)
         logger.info(f"Website saved to: {output_path}")
         
-        # Also save to root directory for GitHub Pages
-        root_index = BASE_DIR.parent / 'index.html'
-        root_index.write_text(html_content, encoding='utf-8')
-        logger.info(f"Also saved to: {root_index}")
+        # Close database connection
+        db.close()
         
         # Deploy if requested
         if args.deploy:
             logger.info("Deploying to GitHub Pages...")
             deploy_to_github()
         
-        # Preview if requested
-        if args.preview:
-            import webbrowser
-            webbrowser.open(f'file://{output_path.absolute()}')
-            logger.info("Opened website in browser")
-        
         # Print summary
         print("\n" + "="*60)
         print("✅ Website Generation Complete!")
@@ -197,19 +97,40 @@ def main():
         print(f"📅 Year Range: {stats.get('year_min', 'N/A')}-{stats.get('year_max', 'N/A')}")
         print(f"🌐 Output: {output_path}")
         
+        # Preview if requested (serves until interrupted)
+        if args.preview:
+            serve_preview(output_path)
+        
         return 0
         
     except Exception as e:
         logger.error(f"Error generating website: {e}", exc_info=True)
         return 1
 
+def serve_preview(output_path: Path):
+    """Serve the website over HTTP and open it in the browser until interrupted"""
+    # The page fetches measures.ndjson, which browsers refuse for file:// pages
+    import functools
+    import webbrowser
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+    
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(output_path.parent))
+    with ThreadingHTTPServer(('127.0.0.1', 0), handler) as server:
+        url = f"http://127.0.0.1:{server.server_address[1]}/{output_path.name}"
+        webbrowser.open(url)
+        logger.info(f"Serving preview at {url} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Preview stopped")
+
 def deploy_to_github():
     """Deploy website to GitHub Pages"""
     try:
         import subprocess
         
         # Stage changes
-        subprocess.run(['git', 'add', '../index.html'], check=True)
+        subprocess.run(['git', 'add', '../index.html', '../measures.ndjson'], check=True)
         subprocess.run(['git', 'add', 'data/'], check=True)
         
         # Commit
@@ -15,6 +15,7 @@ from src.database.operations import Database
 from src.database.deduplication import Deduplicator
 from src.scrapers.ca_sos import CASOSScraper
 from src.enrichment.summaries import SummaryGenerator
+from src.website import WebsiteGenerator
 from src.config import LOG_LEVEL
 
 # Set up logging
@@ -200,6 +201,11 @@ def main():
         action='store_true',
         help='Force update even if no new measures'
     )
+    parser.add_argument(
+        '--website',
+        action='store_true',
+        help='Regenerate the website in this process after updating'
+    )
     
     args = parser.parse_args()
     
@@ -265,6 +271,12 @@ def main():
                 generator.enrich_measures(limit=5)
         else:
             logger.info("\n✅ No updates needed. Database is current.")
+        
+        # Regenerate on the open connection; unchanged data skips the rebuild
+        if args.website:
+            logger.info("\nGenerating website...")
+            output_path = WebsiteGenerator(db).generate()
+            logger.info(f"  Website: {output_path}")
     
     return 0
 
@@ -8,10 +8,14 @@ setup(
     version="2.0.0",
     description="California Ballot Measures Database and API",
     packages=find_packages(),
+    package_data={
+        "src.website": ["templates/*.j2"],
+    },
     install_requires=[
         "requests>=2.31.0",
         "beautifulsoup4>=4.12.0",
         "pandas>=2.1.0",
+        "jinja2>=3.1.0",
         "fastapi>=0.104.0",
         "uvicorn[standard]>=0.24.0",
         "python-dotenv>=1.0.0",
@@ -15,9 +15,11 @@ RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 EXPORTS_DIR = DATA_DIR / "exports"
 DB_PATH = DATA_DIR / "ballot_measures.db"
+HTTP_CACHE_DIR = RAW_DATA_DIR / ".http_cache"
+WEBSITE_STAMP_PATH = DATA_DIR / "website.stamp"
 
 # Ensure directories exist
-for dir_path in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, EXPORTS_DIR]:
+for dir_path in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, EXPORTS_DIR, HTTP_CACHE_DIR]:
     dir_path.mkdir(parents=True, exist_ok=True)
 
 # Database
@@ -34,6 +36,7 @@ SCRAPING_CONFIG = {
     "timeout": int(os.getenv("SCRAPING_TIMEOUT", "30")),
     "user_agent": os.getenv("USER_AGENT", "Mozilla/5.0 (compatible; CA-Ballot-Scraper/2.0)"),
     "max_retries": 3,
+    "http_cache": os.getenv("SCRAPING_HTTP_CACHE", "true").lower() == "true",
 }
 
 # Data Sources
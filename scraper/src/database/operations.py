@@ -267,6 +267,51 @@ class Database:
             measures.append(BallotMeasure.from_dict(dict(row)))
         return measures
     
+    def get_measures_for_website(self, fields: List[str]) -> List[Dict]:
+        """Get active measures as plain dicts with the given website fields"""
+        conn = self.connect()
+        
+        # Display fields resolved in SQL, with year as text
+        derived = {
+            'year': "CAST(year AS TEXT)",
+            'measure_text': "COALESCE(NULLIF(title, ''), ballot_question, 'Unknown Measure')",
+            'source': "COALESCE(data_source, 'Historical')",
+        }
+        
+        columns = [f"{derived[field]} AS {field}" if field in derived else field
+                   for field in fields]
+        cursor = conn.execute(f"""
+            SELECT {', '.join(columns)}
+            FROM active_measures
+            ORDER BY active_measures.year DESC, county, measure_letter
+        """)
+        
+        return [dict(row) for row in cursor]
+    
+    def get_top_topics(self, n: int = 20) -> List[Dict]:
+        """Get the most common topics among active measures"""
+        conn = self.connect()
+        cursor = conn.execute("""
+            SELECT COALESCE(NULLIF(topic_primary, ''), NULLIF(category_topic, '')) AS topic,
+                COUNT(*) AS count
+            FROM active_measures
+            WHERE topic IS NOT NULL
+            GROUP BY topic
+            ORDER BY count DESC, topic
+            LIMIT ?
+        """, (n,))
+        
+        return [{'topic': row['topic'], 'count': row['count']} for row in cursor]
+    
+    def get_data_version(self) -> Dict:
+        """Get row count, highest id and latest update across all measures"""
+        conn = self.connect()
+        cursor = conn.execute("""
+            SELECT COUNT(*) as count, MAX(id) as max_id, MAX(updated_at) as last_updated
+            FROM measures
+        """)
+        return dict(cursor.fetchone())
+    
     def get_statistics(self) -> Dict:
         """Get database statistics"""
         conn = self.connect()
@@ -308,12 +353,14 @@ class Database:
         cursor = conn.execute("""
             SELECT 
                 SUM(CASE WHEN passed = 1 THEN 1 ELSE 0 END) as passed,
-                SUM(CASE WHEN passed = 0 THEN 1 ELSE 0 END) as failed
+                SUM(CASE WHEN passed = 0 THEN 1 ELSE 0 END) as failed,
+                SUM(CASE WHEN passed IS NULL OR passed NOT IN (0, 1) THEN 1 ELSE 0 END) as unknown
             FROM active_measures
         """)
         row = cursor.fetchone()
         stats['passed'] = row['passed'] or 0
         stats['failed'] = row['failed'] or 0
+        stats['unknown_outcome'] = row['unknown'] or 0
         
         return stats
     
@@ -2,34 +2,124 @@
 NCSL (National Conference of State Legislatures) Data Parser
 Handles ballot measures data from 2014-present
 """
+import numpy as np
 import pandas as pd
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional, parse() falls back to reading the xlsx
+    pa = pq = None
+
 logger = logging.getLogger(__name__)
 
+NCSL_FILENAME = 'ncsl_ballot_measures_2014_present.xlsx'
+NCSL_CACHE_FILENAME = 'ncsl_ca_only.parquet'
+
+# Columns read from the NCSL workbook
+NCSL_COLUMNS = [
+    'StateName', 'Year', 'ID', 'Title', 'Summary', 'IRTypeDefinition',
+    'TOPICDESCRIPTION', 'IRStatusDefinition', 'ElectionType', 'PercentageVote'
+]
+
+
+def _candidate_paths(data_dir: Path) -> List[Path]:
+    """Possible locations of the NCSL file, in search order"""
+    return [
+        data_dir / 'downloaded' / NCSL_FILENAME,
+        data_dir / 'raw' / NCSL_FILENAME,
+        data_dir.parent / 'downloaded' / NCSL_FILENAME
+    ]
+
+
+@lru_cache(maxsize=None)
+def _find_ncsl_file(data_dir_str: str) -> Optional[str]:
+    """Search for the NCSL file once per data directory and process"""
+    for path in _candidate_paths(Path(data_dir_str)):
+        if path.exists():
+            logger.info(f"Found NCSL file at: {path}")
+            return str(path)
+    
+    logger.warning("NCSL file not found in any expected location")
+    return None
+
+
+def _classify_outcomes(percent_yes: pd.Series) -> pd.DataFrame:
+    """Classify pass/fail for a whole column of yes-vote percentages at once"""
+    pct = pd.to_numeric(percent_yes, errors='coerce').to_numpy(dtype=float)
+    has_vote = ~np.isnan(pct)
+    passed = pct > 50
+    
+    return pd.DataFrame({
+        '_percent_yes': pct,
+        '_passed': np.where(has_vote, passed.astype(np.int8), -1),
+        '_pass_fail': np.where(has_vote, np.where(passed, 'Pass', 'Fail'), None)
+    }, index=percent_yes.index)
+
+
 class NCSLParser:
     """Parser for NCSL ballot measures Excel files"""
     
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
-        self.file_paths = [
-            data_dir / 'downloaded' / 'ncsl_ballot_measures_2014_present.xlsx',
-            data_dir / 'raw' / 'ncsl_ballot_measures_2014_present.xlsx',
-            data_dir.parent / 'downloaded' / 'ncsl_ballot_measures_2014_present.xlsx'
-        ]
+        self.file_paths = _candidate_paths(data_dir)
     
     def find_file(self) -> Optional[Path]:
         """Find the NCSL file in various possible locations"""
-        for path in self.file_paths:
-            if path.exists():
-                logger.info(f"Found NCSL file at: {path}")
-                return path
+        path = _find_ncsl_file(str(self.data_dir))
+        return Path(path) if path else None
+    
+    def build_cache(self) -> Optional[Path]:
+        """Write the California rows of the NCSL workbook to a parquet sidecar"""
+        file_path = self.find_file()
+        if not file_path or pq is None:
+            return None
         
-        logger.warning("NCSL file not found in any expected location")
-        return None
+        cache_path = file_path.with_name(NCSL_CACHE_FILENAME)
+        
+        try:
+            logger.info(f"Building NCSL cache from {file_path}")
+            df = pd.read_excel(file_path, engine='openpyxl',
+                               usecols=lambda col: col in NCSL_COLUMNS)
+            ca_df = df[df['StateName'] == 'California'].copy()
+            
+            # Arrow needs one type per column; mixed object columns become text
+            for col in ca_df.select_dtypes(include='object').columns:
+                ca_df[col] = ca_df[col].where(ca_df[col].isna(), ca_df[col].astype(str))
+            
+            # Dictionary encoding suits the highly repetitive text columns
+            table = pa.Table.from_pandas(ca_df, preserve_index=False)
+            pq.write_table(table, cache_path, use_dictionary=True)
+            
+            logger.info(f"Saved NCSL cache to: {cache_path}")
+            return cache_path
+            
+        except Exception as e:
+            logger.warning(f"Could not build NCSL cache: {e}")
+            return None
+    
+    def _load_california_rows(self, file_path: Path) -> pd.DataFrame:
+        """Load California rows from the parquet cache, falling back to the xlsx"""
+        if pq is not None:
+            cache_path = file_path.with_name(NCSL_CACHE_FILENAME)
+            
+            # Rebuild whenever the workbook is newer than its cache
+            if not cache_path.exists() or cache_path.stat().st_mtime < file_path.stat().st_mtime:
+                self.build_cache()
+            
+            if cache_path.exists():
+                logger.info(f"Reading NCSL cache from {cache_path}")
+                table = pq.read_table(cache_path, use_threads=True)
+                # Match read_excel's NaN for missing text values
+                return table.to_pandas().fillna(value=np.nan)
+        
+        df = pd.read_excel(file_path)
+        return df[df['StateName'] == 'California'].copy()
     
     def parse(self) -> List[Dict]:
         """Parse NCSL data and return standardized records"""
@@ -40,12 +130,15 @@ class NCSLParser:
         
         try:
             logger.info(f"Parsing NCSL data from {file_path}")
-            df = pd.read_excel(file_path)
             
             # Filter for California
-            ca_df = df[df['StateName'] == 'California'].copy()
+            ca_df = self._load_california_rows(file_path)
             logger.info(f"Found {len(ca_df)} California measures in NCSL data")
             
+            # Vote outcomes are computed column-wise rather than per row
+            percent_yes = ca_df.get('PercentageVote', pd.Series(np.nan, index=ca_df.index))
+            ca_df = ca_df.join(_classify_outcomes(percent_yes))
+            
             measures = []
             for _, row in ca_df.iterrows():
                 measure = self._standardize_record(row)
@@ -81,20 +174,11 @@ class NCSLParser:
                 'election_type': str(row.get('ElectionType', ''))
             }
             
-            # Parse vote data
-            percent_yes = row.get('PercentageVote')
-            if pd.notna(percent_yes):
-                try:
-                    measure['percent_yes'] = float(percent_yes)
-                    # Determine pass/fail based on percentage
-                    if measure['percent_yes'] > 50:
-                        measure['passed'] = 1
-                        measure['pass_fail'] = 'Pass'
-                    else:
-                        measure['passed'] = 0
-                        measure['pass_fail'] = 'Fail'
-                except (ValueError, TypeError):
-                    pass
+            # Vote data, classified for the whole frame in parse()
+            if row.get('_passed', -1) >= 0:
+                measure['percent_yes'] = float(row['_percent_yes'])
+                measure['passed'] = int(row['_passed'])
+                measure['pass_fail'] = row['_pass_fail']
             
             # Clean empty strings
             for key, value in measure.items():
@@ -123,30 +207,21 @@ class NCSLParser:
     
     def validate_data(self, measures: List[Dict]) -> Dict:
         """Validate parsed data and return statistics"""
-        stats = {
-            'total_records': len(measures),
-            'years': set(),
-            'has_title': 0,
-            'has_vote_data': 0,
-            'has_outcome': 0,
-            'topics': set()
-        }
+        df = pd.DataFrame(measures)
         
-        for measure in measures:
-            if measure.get('year'):
-                stats['years'].add(measure['year'])
-            if measure.get('title'):
-                stats['has_title'] += 1
-            if measure.get('percent_yes') is not None:
-                stats['has_vote_data'] += 1
-            if measure.get('passed') is not None:
-                stats['has_outcome'] += 1
-            if measure.get('topic_primary'):
-                stats['topics'].add(measure['topic_primary'])
+        def column(name: str) -> pd.Series:
+            return df[name] if name in df.columns else pd.Series(dtype=object)
         
-        # Convert sets to lists for JSON serialization
-        stats['years'] = sorted(list(stats['years']))
-        stats['topics'] = sorted(list(stats['topics']))
+        # Column-wise counts replace the per-record dict lookups.
+        # Categorical categories come back deduplicated and already sorted.
+        stats = {
+            'total_records': len(df),
+            'years': sorted(column('year').dropna().astype(int).unique().tolist()),
+            'has_title': int(column('title').notna().sum()),
+            'has_vote_data': int(column('percent_yes').notna().sum()),
+            'has_outcome': int(column('passed').notna().sum()),
+            'topics': column('topic_primary').astype('category').cat.categories.tolist()
+        }
         
         return stats
     
@@ -2,14 +2,23 @@
 Base scraper class with common functionality
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import json
+import hashlib
 import logging
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 
-from ..config import SCRAPING_CONFIG, RAW_DATA_DIR
+from ..config import SCRAPING_CONFIG, RAW_DATA_DIR, HTTP_CACHE_DIR
+
+try:
+    import orjson
+except ImportError:  # Optional, falls back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +26,9 @@ logger = logging.getLogger(__name__)
 class BaseScraper(ABC):
     """Base class for all scrapers with common functionality"""
     
-    def __init__(self, source_name: str):
+    def __init__(self, source_name: str, keep_raw: bool = False):
         self.source_name = source_name
+        self.keep_raw = keep_raw
         self.session = self._create_session()
         self.last_request_time = 0
         self.results = []
@@ -29,6 +39,19 @@ class BaseScraper(ABC):
         session.headers.update({
             'User-Agent': SCRAPING_CONFIG['user_agent']
         })
+        
+        # Retries with exponential backoff, honoring Retry-After on 429/503
+        retries = Retry(
+            total=SCRAPING_CONFIG['max_retries'],
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(max_retries=retries, pool_maxsize=20)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
         return session
     
     def _rate_limit(self):
@@ -42,30 +65,83 @@ class BaseScraper(ABC):
             
         self.last_request_time = time.time()
     
+    def _cache_path(self, url: str) -> Path:
+        """Location of the cached copy of a URL"""
+        return HTTP_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+    
+    def _load_cached_page(self, url: str) -> Optional[Dict]:
+        """Load cached body and validators for a URL, if any"""
+        if not SCRAPING_CONFIG['http_cache']:
+            return None
+        
+        cache_path = self._cache_path(url)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+    
+    def _store_cached_page(self, url: str, response: requests.Response):
+        """Cache a response body with its ETag/Last-Modified validators"""
+        if not SCRAPING_CONFIG['http_cache']:
+            return
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        
+        # Without validators a cached copy could never be revalidated
+        if not etag and not last_modified:
+            return
+        
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': response.text
+        }
+        
+        try:
+            with open(self._cache_path(url), 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+        except OSError as e:
+            logger.debug(f"Could not cache {url}: {e}")
+    
     def _fetch_page(self, url: str, **kwargs) -> Optional[str]:
         """Fetch a page with retries and error handling"""
-        max_retries = SCRAPING_CONFIG['max_retries']
         timeout = SCRAPING_CONFIG['timeout']
         
-        for attempt in range(max_retries):
-            try:
-                self._rate_limit()
-                
-                logger.info(f"Fetching: {url} (attempt {attempt + 1}/{max_retries})")
-                response = self.session.get(url, timeout=timeout, **kwargs)
-                response.raise_for_status()
-                
-                return response.text
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed: {e}")
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.info(f"Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Failed to fetch {url} after {max_retries} attempts")
-                    return None
+        # Revalidate a cached copy with a conditional GET
+        cached = self._load_cached_page(url)
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        # Retries and backoff are handled by the session's adapter
+        try:
+            self._rate_limit()
+            
+            logger.info(f"Fetching: {url}")
+            response = self.session.get(url, timeout=timeout, headers=headers, **kwargs)
+            
+            if response.status_code == 304 and cached:
+                logger.info(f"Not modified, using cached copy of {url}")
+                return cached['body']
+            
+            response.raise_for_status()
+            self._store_cached_page(url, response)
+            
+            return response.text
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
     
     def _save_raw_data(self, data: Dict, filename: str = None):
         """Save raw scraped data"""
@@ -75,9 +151,12 @@ class BaseScraper(ABC):
         
         filepath = RAW_DATA_DIR / filename
         
-        import json
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if orjson is not None:
+            # Serialize in C and write the bytes in one call
+            filepath.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
         
         logger.info(f"Saved raw data to: {filepath}")
         return filepath
@@ -108,14 +187,14 @@ class BaseScraper(ABC):
         
         return None
     
-    def _standardize_measure(self, raw_measure: Dict) -> Dict:
+    def _standardize_measure(self, raw_measure: Dict, scraped_at: str = None) -> Dict:
         """Standardize measure data to common format"""
         # Extract measure ID
         measure_text = raw_measure.get('measure_text', '')
         measure_id = self._extract_measure_id(measure_text)
         
         # Standard format
-        return {
+        measure = {
             'source': self.source_name,
             'measure_id': measure_id,
             'year': raw_measure.get('year'),
@@ -126,9 +205,14 @@ class BaseScraper(ABC):
             'source_url': raw_measure.get('source_url'),
             'election_date': raw_measure.get('election_date'),
             'election_type': raw_measure.get('election_type'),
-            'scraped_at': datetime.now().isoformat(),
-            'raw_data': raw_measure  # Keep original data
+            'scraped_at': scraped_at or datetime.now().isoformat(),
         }
+        
+        # Original data roughly doubles the output size, so only keep it on request
+        if self.keep_raw:
+            measure['raw_data'] = raw_measure
+        
+        return measure
     
     @abstractmethod
     def scrape(self) -> List[Dict]:
@@ -144,15 +228,18 @@ class BaseScraper(ABC):
             # Run the scraper
             raw_measures = self.scrape()
             
+            # One timestamp for the whole run
+            scraped_at = datetime.now().isoformat()
+            
             # Standardize the results
             standardized_measures = [
-                self._standardize_measure(m) for m in raw_measures
+                self._standardize_measure(m, scraped_at) for m in raw_measures
             ]
             
             # Prepare results
             results = {
                 'source': self.source_name,
-                'scraped_at': datetime.now().isoformat(),
+                'scraped_at': scraped_at,
                 'duration_seconds': time.time() - start_time,
                 'total_measures': len(standardized_measures),
                 'measures': standardized_measures
@@ -12,12 +12,21 @@ from ..config import SOURCES
 
 logger = logging.getLogger(__name__)
 
+# CSS selectors let the selector engine skip non-matching anchors
+PDF_LINK_SELECTOR = 'h2, h3, a[href$=".pdf" i]'
+PROPOSITION_LINK_SELECTOR = 'a[href*="/ca_ballot_props/"]'
+
+# Election header patterns (e.g., "November 5, 2024 General Election")
+ELECTION_DATE_RE = re.compile(r'(\w+\s+\d{1,2},\s+\d{4})')
+ELECTION_TYPE_RE = re.compile(r'general|primary|special', re.I)
+ELECTION_TYPE_PRIORITY = ('general', 'primary', 'special')
+
 
 class CASOSScraper(BaseScraper):
     """Scraper for California Secretary of State ballot measures"""
     
-    def __init__(self):
-        super().__init__("CA_SOS")
+    def __init__(self, keep_raw: bool = False):
+        super().__init__("CA_SOS", keep_raw=keep_raw)
         self.config = SOURCES["ca_sos"]
         self.base_url = self.config["base_url"]
         
@@ -49,8 +58,9 @@ class CASOSScraper(BaseScraper):
         measures = []
         current_election = None
         
-        # The CA SOS site structure: election headers are <h2>, measures are links
-        for tag in soup.find_all(["h2", "h3", "a"]):
+        # The CA SOS site structure: election headers are <h2>, measures are links.
+        # The selector only matches PDF anchors, so nav/footer links never reach Python.
+        for tag in soup.select(PDF_LINK_SELECTOR):
             if tag.name in ["h2", "h3"]:
                 # This is an election header
                 election_text = tag.get_text(strip=True)
@@ -60,8 +70,6 @@ class CASOSScraper(BaseScraper):
                 
             if tag.name == "a":
                 href = tag.get("href", "")
-                if not href.lower().endswith(".pdf"):
-                    continue
                     
                 # This is a measure PDF link
                 measure_text = tag.get_text(" ", strip=True)
@@ -89,17 +97,17 @@ class CASOSScraper(BaseScraper):
         }
         
         # Try to extract date (e.g., "November 5, 2024")
-        date_match = re.search(r'(\w+\s+\d{1,2},\s+\d{4})', election_text)
+        date_match = ELECTION_DATE_RE.search(election_text)
         if date_match:
             info['date'] = date_match.group(1)
             
-        # Determine election type
-        if 'general' in election_text.lower():
-            info['type'] = 'General'
-        elif 'primary' in election_text.lower():
-            info['type'] = 'Primary'
-        elif 'special' in election_text.lower():
-            info['type'] = 'Special'
+        # Determine election type in a single scan; "general" wins over
+        # "special" in headers such as "Special General Election"
+        found = {match.lower() for match in ELECTION_TYPE_RE.findall(election_text)}
+        for election_type in ELECTION_TYPE_PRIORITY:
+            if election_type in found:
+                info['type'] = election_type.title()
+                break
             
         return info
     
@@ -137,8 +145,8 @@ class CASOSScraper(BaseScraper):
 class UCLawSFScraper(BaseScraper):
     """Scraper for UC Law SF historical ballot measures"""
     
-    def __init__(self, max_items: int = None):
-        super().__init__("UC_Law_SF")
+    def __init__(self, max_items: int = None, keep_raw: bool = False):
+        super().__init__("UC_Law_SF", keep_raw=keep_raw)
         self.config = SOURCES["uc_law_sf"]
         self.base_url = self.config["base_url"]
         self.max_items = max_items or self.config.get("max_items", 50)
@@ -160,14 +168,14 @@ class UCLawSFScraper(BaseScraper):
         
         # Find all proposition links
         links_found = 0
-        for link in soup.find_all('a', href=True):
+        for link in soup.select(PROPOSITION_LINK_SELECTOR):
             if links_found >= self.max_items:
                 break
                 
             href = link.get('href', '')
             
-            # Look for ballot proposition links
-            if '/ca_ballot_props/' in href and href.count('/') >= 4:
+            # Skip the collection index itself, keep individual propositions
+            if href.count('/') >= 4:
                 title = link.get_text(strip=True)
                 if not title:
                     continue
@@ -2,290 +2,117 @@
 Website generator for ballot measures
 Generates modern, responsive HTML with faceted navigation
 """
+import os
+import math
+import gzip
 import json
+import hashlib
+import shutil
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
-from collections import Counter
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from ..database.operations import Database
-from ..database.models import BallotMeasure
-from ..config import WEBSITE_CONFIG, BASE_DIR
+from ..config import WEBSITE_CONFIG, BASE_DIR, WEBSITE_STAMP_PATH
+
+try:
+    import orjson
+except ImportError:  # Optional, falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # Optional, only the gzip variant is written
+    brotli = None
 
 logger = logging.getLogger(__name__)
 
 
-class WebsiteGenerator:
-    """Generates static website from ballot measures data"""
-    
-    def __init__(self, database: Database = None, output_path: Path = None):
-        self.db = database or Database()
-        self.output_path = output_path or BASE_DIR.parent / WEBSITE_CONFIG['output_filename']
-        self.template = WEBSITE_CONFIG.get('template', 'modern')
-        self.features = WEBSITE_CONFIG.get('features', {})
-        
-    def generate(self) -> Path:
-        """Generate the complete website"""
-        logger.info("Generating website...")
-        
-        # Get data from database
-        measures = self.db.get_all_active_measures()
-        stats = self.db.get_statistics()
-        
-        # Process data for website
-        measures_data = self._prepare_measures_data(measures)
-        topics = self._extract_topics(measures)
-        
-        # Generate HTML
-        html = self._generate_html(measures_data, stats, topics)
-        
-        # Save to file
-        self.output_path.write_text(html, encoding='utf-8')
-        logger.info(f"Website generated: {self.output_path}")
-        
-        # Also save to index.html in parent directory for GitHub Pages
-        index_path = BASE_DIR.parent / 'index.html'
-        index_path.write_text(html, encoding='utf-8')
-        logger.info(f"Also saved to: {index_path}")
-        
-        return self.output_path
-    
-    def _prepare_measures_data(self, measures: List[BallotMeasure]) -> List[Dict]:
-        """Convert measures to format needed for website"""
-        measures_data = []
-        
-        for measure in measures:
-            # Convert to dict
-            data = measure.to_dict()
-            
-            # Add display fields
-            data['measure_text'] = data.get('title') or data.get('ballot_question', 'Unknown Measure')
-            data['source'] = data.get('data_source', 'Historical')
-            
-            # Ensure year is string for consistency
-            if data.get('year'):
-                data['year'] = str(data['year'])
-            
-            measures_data.append(data)
-        
-        return measures_data
-    
-    def _extract_topics(self, measures: List[BallotMeasure]) -> List[Dict]:
-        """Extract topic information for filters"""
-        topic_counts = Counter()
-        
-        for measure in measures:
-            topic = measure.topic_primary or measure.category_topic
-            if topic:
-                topic_counts[topic] += 1
-        
-        # Return top 20 topics
-        topics = [
-            {'topic': topic, 'count': count}
-            for topic, count in topic_counts.most_common(20)
-        ]
-        
-        return topics
-    
-    def _generate_html(self, measures: List[Dict], stats: Dict, 
-                      topics: List[Dict]) -> str:
-        """Generate the complete HTML"""
-        # Convert data to JSON for embedding
-        measures_json = json.dumps(measures, default=str)
-        topics_json = json.dumps(topics, default=str)
-        
-        # Calculate additional stats
-        total_with_outcome = stats['passed'] + stats['failed']
-        pass_rate = round((stats['passed'] / total_with_outcome * 100)) if total_with_outcome > 0 else 0
-        
-        # Generate HTML using modern template
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>California Ballot Measures Database</title>
-    <style>
-        {self._get_css()}
-    </style>
-</head>
-<body>
-    <!-- Header -->
-    <header class="header">
-        <div class="header-content">
-            <div class="logo">
-                <div class="logo-icon">CA</div>
-                <h1>California Ballot Measures</h1>
-            </div>
-            
-            <div class="search-container">
-                <div class="search-box">
-                    <svg class="search-icon" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                        <circle cx="11" cy="11" r="8"></circle>
-                        <path d="m21 21-4.35-4.35"></path>
-                    </svg>
-                    <input type="text" class="search-input" id="searchInput" placeholder="Search measures by title, topic, or year...">
-                </div>
-            </div>
-            
-            <div class="view-controls">
-                <button class="view-btn active" id="gridView" onclick="setView('grid')">
-                    <svg width="16" height="16" viewBox="0 0 24 24" fill="currentColor">
-                        <rect x="3" y="3" width="7" height="7"></rect>
-                        <rect x="14" y="3" width="7" height="7"></rect>
-                        <rect x="3" y="14" width="7" height="7"></rect>
-                        <rect x="14" y="14" width="7" height="7"></rect>
-                    </svg>
-                </button>
-                <button class="view-btn" id="listView" onclick="setView('list')">
-                    <svg width="16" height="16" viewBox="0 0 24 24" fill="currentColor">
-                        <rect x="3" y="4" width="18" height="2"></rect>
-                        <rect x="3" y="11" width="18" height="2"></rect>
-                        <rect x="3" y="18" width="18" height="2"></rect>
-                    </svg>
-                </button>
-            </div>
-        </div>
-    </header>
+def _encode(data) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode('utf-8')
 
-    <!-- Main Content -->
-    <div class="main-container">
-        <!-- Sidebar Filters -->
-        <aside class="sidebar">
-            <div class="filter-section">
-                <div class="filter-header">
-                    Filters
-                    <span class="filter-clear" onclick="clearAllFilters()">Clear all</span>
-                </div>
-                
-                <!-- Year Range -->
-                <div class="filter-group">
-                    <div class="filter-label">Year Range</div>
-                    <div class="year-range">
-                        <input type="number" class="year-input" id="yearMin" value="{stats.get('year_min', 1902)}" min="{stats.get('year_min', 1902)}" max="{stats.get('year_max', 2026)}">
-                        <span class="year-separator">–</span>
-                        <input type="number" class="year-input" id="yearMax" value="{stats.get('year_max', 2026)}" min="{stats.get('year_min', 1902)}" max="{stats.get('year_max', 2026)}">
-                    </div>
-                </div>
-                
-                <!-- Status Filter -->
-                <div class="filter-group">
-                    <div class="filter-label">Status</div>
-                    <div class="filter-options">
-                        <div class="filter-option" onclick="toggleFilter('status', 'passed')">
-                            <span class="filter-option-label">Passed</span>
-                            <span class="filter-option-count">{stats['passed']}</span>
-                        </div>
-                        <div class="filter-option" onclick="toggleFilter('status', 'failed')">
-                            <span class="filter-option-label">Failed</span>
-                            <span class="filter-option-count">{stats['failed']}</span>
-                        </div>
-                        <div class="filter-option" onclick="toggleFilter('status', 'unknown')">
-                            <span class="filter-option-label">Unknown</span>
-                            <span class="filter-option-count">{stats['total_measures'] - stats['passed'] - stats['failed']}</span>
-                        </div>
-                    </div>
-                </div>
-                
-                <!-- Features Filter -->
-                <div class="filter-group">
-                    <div class="filter-label">Features</div>
-                    <div class="filter-options">
-                        <div class="filter-option" onclick="toggleFilter('features', 'summary')">
-                            <span class="filter-option-label">Has Summary</span>
-                            <span class="filter-option-count">{stats['with_summaries']}</span>
-                        </div>
-                        <div class="filter-option" onclick="toggleFilter('features', 'votes')">
-                            <span class="filter-option-label">Has Vote Data</span>
-                            <span class="filter-option-count">{stats['with_votes']}</span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Topic Filter -->
-            <div class="filter-section">
-                <div class="filter-header">Popular Topics</div>
-                <div class="topic-tags" id="topicTags">
-                    <!-- Will be populated by JavaScript -->
-                </div>
-            </div>
-        </aside>
 
-        <!-- Main Content Area -->
-        <main class="content">
-            <!-- Stats Dashboard -->
-            <div class="stats-dashboard">
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_measures']:,}</div>
-                    <div class="stat-label">Total Measures</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{pass_rate}%</div>
-                    <div class="stat-label">Pass Rate</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['year_max'] - stats['year_min']} years</div>
-                    <div class="stat-label">Historical Coverage</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{len(topics)}</div>
-                    <div class="stat-label">Topic Categories</div>
-                </div>
-            </div>
+def _encode_line(data) -> bytes:
+    """Serialize data to one newline-terminated JSON Lines record"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, default=str) + '\n').encode('utf-8')
 
-            <!-- Results Header -->
-            <div class="results-header">
-                <div class="results-info">
-                    <div class="results-count" id="resultsCount">0</div>
-                    <div class="results-description" id="resultsDescription">measures found</div>
-                </div>
-                <div class="sort-controls">
-                    <span class="sort-label">Sort by:</span>
-                    <select class="sort-select" id="sortSelect" onchange="applySort()">
-                        <option value="year-desc">Year (Newest First)</option>
-                        <option value="year-asc">Year (Oldest First)</option>
-                        <option value="title">Title (A-Z)</option>
-                        <option value="votes">Most Votes</option>
-                    </select>
-                </div>
-            </div>
 
-            <!-- Featured Section -->
-            <div class="featured-section" id="featuredSection">
-                <h2 class="section-title">Recent Measures</h2>
-                <div class="featured-grid" id="featuredGrid">
-                    <!-- Will be populated by JavaScript -->
-                </div>
-            </div>
+def _dumps(data) -> str:
+    """Serialize data to a JSON string"""
+    return _encode(data).decode('utf-8')
 
-            <!-- Results Container -->
-            <div id="resultsContainer">
-                <div class="loading">
-                    <div class="spinner"></div>
-                </div>
-            </div>
-        </main>
-    </div>
 
-    <!-- Footer -->
-    <footer class="footer">
-        <p>California Ballot Measures Database • Updated {datetime.now().strftime('%B %d, %Y')}</p>
-        <p>Data sources: CA Secretary of State, NCSL, ICPSR, CEDA</p>
-    </footer>
+def _script_json(data) -> str:
+    """Serialize data to JSON that can be inlined in a <script> element"""
+    # Markup characters in a value ("</script>", "<!--") would otherwise
+    # change how the HTML parser reads the script element
+    return (_dumps(data).replace('<', '\\u003c')
+            .replace('>', '\\u003e').replace('&', '\\u0026'))
 
-    <script>
-        {self._get_javascript(measures_json, topics_json, stats)}
-    </script>
-</body>
-</html>"""
-        
-        return html
-    
-    def _get_css(self) -> str:
-        """Get CSS styles for the website"""
-        return """
+
+def _staging_path(path: Path) -> Path:
+    """Temporary sibling of path, on the same filesystem so os.replace() is atomic"""
+    return path.with_name(f".{path.name}.tmp")
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """Hard-link dst to src, falling back to a file copy across filesystems"""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _gzip(data: bytes) -> bytes:
+    """Gzip at the highest level with a fixed mtime, for reproducible output"""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli(data: bytes) -> bytes:
+    """Brotli at the highest quality"""
+    return brotli.compress(data, quality=11)
+
+
+# Pre-compressed variants written next to each output, by file suffix
+_COMPRESSORS = {'.gz': _gzip}
+if brotli is not None:
+    _COMPRESSORS['.br'] = _brotli
+
+
+def _write_compressed(path: Path, suffix: str) -> Path:
+    """Write a pre-compressed sibling of path for static hosts to serve"""
+    compressed_path = path.with_name(path.name + suffix)
+    staging_path = _staging_path(compressed_path)
+    staging_path.write_bytes(_COMPRESSORS[suffix](path.read_bytes()))
+    os.replace(staging_path, compressed_path)
+    return compressed_path
+
+
+# Measures are served next to the page as JSON Lines and fetched lazily
+_MEASURES_FILENAME = 'measures.ndjson'
+
+# Low-cardinality fields written to measures.ndjson as indexes into lookup tables
+_INTERNED_FIELDS = ('topic_primary', 'category_topic', 'data_source', 'source')
+
+# Measure fields read by the page's JavaScript; nothing else is published
+_WEBSITE_FIELDS = (
+    'id', 'year', 'title', 'measure_text', 'description', 'summary_text',
+    'topic_primary', 'category_topic', 'passed', 'has_summary', 'yes_votes',
+    'percent_yes', 'total_votes', 'data_source', 'source', 'pdf_url'
+)
+
+
+# Static stylesheet, built once at import
+_CSS_STATIC = """
         /* Modern CSS Reset and Variables */
         * {
             margin: 0;
@@ -830,6 +657,28 @@ class WebsiteGenerator:
             to { transform: rotate(360deg); }
         }
         
+        /* Show More */
+        .show-more {
+            display: block;
+            margin: 2rem auto 0;
+            padding: 0.75rem 1.5rem;
+            border: 1px solid var(--border);
+            background: var(--bg-primary);
+            border-radius: var(--radius);
+            color: var(--primary);
+            font-weight: 500;
+            cursor: pointer;
+            transition: var(--transition);
+        }
+        
+        .show-more:hover {
+            background: var(--bg-secondary);
+        }
+        
+        .show-more[hidden] {
+            display: none;
+        }
+        
         /* Empty State */
         .empty-state {
             text-align: center;
@@ -894,238 +743,591 @@ class WebsiteGenerator:
             }
         }
         """
-    
-    def _get_javascript(self, measures_json: str, topics_json: str, 
-                       stats: Dict) -> str:
-        """Get JavaScript code for the website"""
-        return f"""
-        // Data
-        const allMeasures = {measures_json};
-        const topics = {topics_json};
+
+# Static page script; per-build data reaches it through the #pageData block
+_JS_STATIC = """
+        // Data: measures stream in from measures.ndjson, the rest is the
+        // #pageData JSON block (JSON.parse is cheaper than a script literal)
+        const allMeasures = [];
+        const measuresById = new Map();
+        const { topics, init: INIT } = JSON.parse(document.getElementById('pageData').textContent);
         
         // State
         let currentView = 'grid';
-        let currentFilters = {{
-            yearMin: {stats.get('year_min', 1902)},
-            yearMax: {stats.get('year_max', 2026)},
+        let currentFilters = {
+            yearMin: INIT.yearMin,
+            yearMax: INIT.yearMax,
             status: [],
             features: [],
             topics: [],
             search: ''
-        }};
+        };
         let currentSort = 'year-desc';
         let filteredMeasures = [];
         
+        // Filter options by "type:value" and topic tags by topic, looked up
+        // on every toggle instead of querying the document
+        const filterOptionEls = new Map();
+        const topicTagEls = new Map();
+        
         // Initialize
-        document.addEventListener('DOMContentLoaded', () => {{
+        document.addEventListener('DOMContentLoaded', () => {
             initializeTopicTags();
             setupEventListeners();
-            applyFilters();
-        }});
+            loadMeasures().catch(err => {
+                console.error('Failed to load measures:', err);
+                const notice = document.createElement('div');
+                notice.className = 'empty-state';
+                notice.innerHTML = `
+                    <h3>Could not load measures</h3>
+                    <p>Please try reloading the page</p>
+                `;
+                
+                // Keep any cards already shown; only a bare spinner is replaced
+                const container = document.getElementById('resultsContainer');
+                if (document.getElementById('resultsList')) {
+                    container.prepend(notice);
+                } else {
+                    container.replaceChildren(notice);
+                }
+            });
+        });
+        
+        // Filtering and sorting run in a worker that keeps a columnar index
+        // of the measures, so typing never blocks the page. It is written as a
+        // function and started from its own source through a blob URL
+        function filterWorkerMain() {
+            const STATUS_KINDS = ['passed', 'failed', 'unknown'];
+            
+            // Column store over rows in arrival order: numbers in typed arrays
+            // (grown by doubling, `count` rows in use), strings in plain arrays
+            const index = {
+                count: 0,
+                year: new Int16Array(1024),
+                votes: new Uint32Array(1024),
+                text: [],
+                title: []
+            };
+            
+            function reserve(rows) {
+                if (rows <= index.year.length) return;
+                let size = index.year.length * 2;
+                while (size < rows) size *= 2;
+                for (const column of ['year', 'votes']) {
+                    const grown = new index[column].constructor(size);
+                    grown.set(index[column]);
+                    index[column] = grown;
+                }
+            }
+            
+            // Inverted indexes: ascending row ids per topic, status and feature
+            const postings = {
+                topic: new Map(),
+                status: STATUS_KINDS.map(() => []),
+                summary: [],
+                votes: []
+            };
+            
+            function indexMeasure(measure) {
+                const row = index.count++;
+                const status = measure.passed === 1 ? 0 : measure.passed === 0 ? 1 : 2;
+                const topic = measure.topic_primary || measure.category_topic || '';
+                
+                if (!postings.topic.has(topic)) postings.topic.set(topic, []);
+                postings.topic.get(topic).push(row);
+                postings.status[status].push(row);
+                if (measure.has_summary) postings.summary.push(row);
+                if (measure.yes_votes != null) postings.votes.push(row);
+                
+                // Unknown years are stored as 0
+                const year = parseInt(measure.year) || 0;
+                if (year < 0 || (row > 0 && year > index.year[row - 1])) yearsDescending = false;
+                index.year[row] = year;
+                index.votes[row] = measure.total_votes || 0;
+                // measure_text usually repeats the title; scan each value once
+                const searchFields = new Set([
+                    measure.title,
+                    measure.measure_text,
+                    measure.description,
+                    measure.summary_text,
+                    measure.topic_primary,
+                    measure.year
+                ].filter(Boolean));
+                index.text.push([...searchFields].join(' ').toLowerCase());
+                index.title.push(measure.title || measure.measure_text || '');
+            }
+            
+            // Per-row count of satisfied posting-list filters, reused across
+            // requests and grown as records arrive
+            let mask = new Uint8Array(0);
+            
+            function filterIds(filters) {
+                const { count, year, text } = index;
+                
+                // Each selected filter advances the rows it allows from p to p + 1,
+                // so rows passing all of them end at predicates.length
+                const predicates = postingFilters(filters);
+                if (predicates.length > 0) {
+                    if (mask.length < count) mask = new Uint8Array(count);
+                    mask.fill(0);
+                    predicates.forEach((lists, p) => {
+                        for (const list of lists) {
+                            for (let k = 0; k < list.length; k++) {
+                                if (mask[list[k]] === p) mask[list[k]] = p + 1;
+                            }
+                        }
+                    });
+                }
+                
+                // Per-request values hoisted out of the row loop, which tests the
+                // cheapest predicates first and the text scan last
+                const required = predicates.length;
+                const { yearMin, yearMax, search } = filters;
+                
+                const ids = [];
+                for (const [start, end, checkYear] of yearRuns(filters)) {
+                    // Nothing else selected: the whole run matches
+                    if (required === 0 && !checkYear && !search) {
+                        for (let i = start; i < end; i++) ids.push(i);
+                        continue;
+                    }
+                    
+                    for (let i = start; i < end; i++) {
+                        // Topic, status and features filters
+                        if (required > 0 && mask[i] !== required) continue;
+                        
+                        // Year filter (measures without a year always match)
+                        if (checkYear && year[i] !== 0 &&
+                            (year[i] < yearMin || year[i] > yearMax)) continue;
+                        
+                        // Search filter
+                        if (search && !text[i].includes(search)) continue;
+                        
+                        ids.push(i);
+                    }
+                }
+                return ids;
+            }
+            
+            // Rows arrive newest year first with unknown years (0) last, so the
+            // year range is one run of rows found by binary search, followed by
+            // the unknown-year run. Rows out of that order fall back to a full scan
+            let yearsDescending = true;
+            
+            function yearRuns(filters) {
+                const { count } = index;
+                if (!yearsDescending) return [[0, count, true]];
+                
+                // An emptied year input leaves that end of the range open
+                const yearMax = Number.isNaN(filters.yearMax) ? Infinity : filters.yearMax;
+                const yearMin = Number.isNaN(filters.yearMin) ? -Infinity : filters.yearMin;
+                const unknown = firstBelow(1);
+                const start = firstBelow(yearMax + 1);
+                const end = Math.min(Math.max(start, firstBelow(yearMin)), unknown);
+                return [[start, end, false], [unknown, count, false]];
+            }
+            
+            // First row whose year is below limit, over the descending year column
+            function firstBelow(limit) {
+                const { count, year } = index;
+                let lo = 0;
+                let hi = count;
+                while (lo < hi) {
+                    const mid = (lo + hi) >> 1;
+                    if (year[mid] < limit) hi = mid;
+                    else lo = mid + 1;
+                }
+                return lo;
+            }
+            
+            // Posting lists per selected filter; a row matches a filter when it is
+            // in any of its lists (lists within one filter are disjoint)
+            function postingFilters(filters) {
+                const predicates = [];
+                if (filters.topics.length > 0) {
+                    predicates.push(filters.topics.map(topic => postings.topic.get(topic) || []));
+                }
+                if (filters.status.length > 0) {
+                    predicates.push(STATUS_KINDS
+                        .filter(kind => filters.status.includes(kind))
+                        .map(kind => postings.status[STATUS_KINDS.indexOf(kind)]));
+                }
+                if (filters.features.includes('summary')) predicates.push([postings.summary]);
+                if (filters.features.includes('votes')) predicates.push([postings.votes]);
+                return predicates;
+            }
+            
+            // Titles are collated once and cached as per-row ranks, so title
+            // sorts compare integers; more records reset the ranks
+            let titleRank = null;
+            function titleRanks() {
+                if (!titleRank) {
+                    const { title } = index;
+                    const ids = title.map((_, i) => i)
+                        .sort((a, b) => title[a].localeCompare(title[b]));
+                    titleRank = new Int32Array(title.length);
+                    let rank = 0;
+                    ids.forEach((id, n) => {
+                        if (n > 0 && title[ids[n - 1]].localeCompare(title[id]) !== 0) rank++;
+                        titleRank[id] = rank;
+                    });
+                }
+                return titleRank;
+            }
+            
+            // Comparators over row ids, built per request
+            const sorters = {
+                'year-desc': () => {
+                    const { year } = index;
+                    return (a, b) => year[b] - year[a];
+                },
+                'year-asc': () => {
+                    const { year } = index;
+                    return (a, b) => year[a] - year[b];
+                },
+                'title': () => {
+                    const rank = titleRanks();
+                    return (a, b) => rank[a] - rank[b];
+                },
+                'votes': () => {
+                    const { votes } = index;
+                    return (a, b) => votes[b] - votes[a];
+                }
+            };
+            
+            // Move the k first ids under compare to the front, in no particular
+            // order (quickselect); the rest of the array is left unordered
+            function selectTop(ids, compare, k) {
+                let left = 0;
+                let right = ids.length - 1;
+                while (left < right) {
+                    const pivot = ids[(left + right) >> 1];
+                    let i = left;
+                    let j = right;
+                    while (i <= j) {
+                        while (compare(ids[i], pivot) < 0) i++;
+                        while (compare(ids[j], pivot) > 0) j--;
+                        if (i <= j) {
+                            [ids[i], ids[j]] = [ids[j], ids[i]];
+                            i++;
+                            j--;
+                        }
+                    }
+                    if (k - 1 <= j) right = j;
+                    else if (k - 1 >= i) left = i;
+                    else break;
+                }
+            }
+            
+            // Only the first `limit` rows are shown, so only those are sorted.
+            // Ties fall back to row order, matching a full stable sort
+            function orderTop(filtered, sort, limit) {
+                if (!sorters[sort]) return filtered.slice(0, limit);
+                
+                const sorter = sorters[sort]();
+                
+                const compare = (a, b) => sorter(a, b) || a - b;
+                const ids = filtered.slice();
+                if (limit < ids.length) {
+                    selectTop(ids, compare, limit);
+                    ids.length = limit;
+                }
+                return ids.sort(compare);
+            }
+            
+            // Recent filter results (in row order) by filter signature, least
+            // recently used first; cleared whenever more records arrive
+            const resultCache = new Map();
+            const RESULT_CACHE_SIZE = 16;
+            
+            self.onmessage = ({ data }) => {
+                if (data.records) {
+                    reserve(index.count + data.records.length);
+                    data.records.forEach(indexMeasure);
+                    resultCache.clear();
+                    titleRank = null;
+                    return;
+                }
+                
+                const filters = data.filters;
+                const key = JSON.stringify([
+                    filters.yearMin, filters.yearMax, [...filters.status].sort(),
+                    [...filters.features].sort(), [...filters.topics].sort(), filters.search
+                ]);
+                let filtered = resultCache.get(key);
+                if (filtered) {
+                    resultCache.delete(key);
+                } else {
+                    filtered = filterIds(filters);
+                }
+                resultCache.set(key, filtered);
+                if (resultCache.size > RESULT_CACHE_SIZE) {
+                    resultCache.delete(resultCache.keys().next().value);
+                }
+                
+                self.postMessage({
+                    seq: data.seq,
+                    ids: orderTop(filtered, data.sort, data.limit),
+                    total: filtered.length
+                });
+            };
+        }
+        
+        const filterWorker = new Worker(URL.createObjectURL(new Blob(
+            [`(${filterWorkerMain.toString()})();`], { type: 'text/javascript' })));
+        let pendingRecords = [];
+        let filterSeq = 0;
+        
+        // Results arrive a page at a time; filteredMeasures holds the leading
+        // resultLimit rows of filteredTotal matches
+        const PAGE_SIZE = INIT.pageSize;
+        let resultLimit = PAGE_SIZE;
+        let filteredTotal = 0;
+        let paintedSeq = 0;
+        let appendSeq = 0;
+        
+        // Paint only the reply to the latest request; older ones are superseded.
+        // A further page of unchanged results (appendSeq) only appends its new rows
+        filterWorker.onmessage = ({ data }) => {
+            if (data.seq !== filterSeq) return;
+            const shown = filteredMeasures.length;
+            filteredMeasures = data.ids.map(i => allMeasures[i]);
+            filteredTotal = data.total;
+            paintedSeq = data.seq;
+            
+            if (data.seq === appendSeq) {
+                appendResults(filteredMeasures.slice(shown));
+            } else {
+                updateResults();
+            }
+        };
+        
+        // Load the next page once the end of the list comes near the viewport
+        const moreObserver = new IntersectionObserver((entries) => {
+            if (entries.some(entry => entry.isIntersecting)) showMore();
+        }, { rootMargin: '400px' });
+        
+        // Stream measures line by line, repainting as rows arrive
+        async function loadMeasures() {
+            const response = await fetch(INIT.measuresUrl);
+            if (!response.ok || !response.body) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = '';
+            let lastPaint = performance.now();
+            
+            // The first line names the columns of each row and holds lookup
+            // tables for fields stored as indexes
+            let header = null;
+            function addRecord(line) {
+                const row = JSON.parse(line);
+                if (!header) {
+                    header = row;
+                    return;
+                }
+                const record = {};
+                header.cols.forEach((col, i) => { record[col] = row[i]; });
+                for (const field in header.tables) {
+                    if (record[field] != null) record[field] = header.tables[field][record[field]];
+                }
+                allMeasures.push(record);
+                measuresById.set(record.id, record);
+                pendingRecords.push(record);
+            }
+            
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                
+                buffer += value;
+                const lines = buffer.split('\\n');
+                buffer = lines.pop();
+                for (const line of lines) {
+                    if (line) addRecord(line);
+                }
+                
+                // Show the first cards early without re-filtering on every chunk;
+                // pages already shown stay loaded
+                if (performance.now() - lastPaint > 250) {
+                    lastPaint = performance.now();
+                    requestResults();
+                }
+            }
+            
+            if (buffer.trim()) addRecord(buffer);
+            requestResults();
+        }
         
         // Initialize topic tags
-        function initializeTopicTags() {{
+        function initializeTopicTags() {
+            const fragment = document.createDocumentFragment();
+            for (const topic of topics.slice(0, 12)) {
+                const tag = document.createElement('div');
+                tag.className = 'topic-tag';
+                tag.dataset.topic = topic.topic;
+                tag.textContent = `${topic.topic} (${topic.count})`;
+                topicTagEls.set(topic.topic, tag);
+                fragment.appendChild(tag);
+            }
+            
             const container = document.getElementById('topicTags');
-            container.innerHTML = topics.slice(0, 12).map(topic => `
-                <div class="topic-tag" onclick="toggleTopic('${{topic.topic.replace(/'/g, "\\\\'")}}')">
-                    ${{topic.topic}} (${{topic.count}})
-                </div>
-            `).join('');
-        }}
+            container.replaceChildren(fragment);
+            container.addEventListener('click', (e) => {
+                const tag = e.target.closest('.topic-tag');
+                if (tag) toggleTopic(tag.dataset.topic);
+            });
+        }
+        
+        // Run fn only once calls have stopped for the given delay
+        function debounce(fn, delay) {
+            let timeout;
+            return (...args) => {
+                clearTimeout(timeout);
+                timeout = setTimeout(() => fn(...args), delay);
+            };
+        }
         
         // Setup event listeners
-        function setupEventListeners() {{
-            // Search input with debounce
-            let searchTimeout;
-            document.getElementById('searchInput').addEventListener('input', (e) => {{
-                clearTimeout(searchTimeout);
-                searchTimeout = setTimeout(() => {{
-                    currentFilters.search = e.target.value.toLowerCase();
-                    applyFilters();
-                }}, 300);
-            }});
+        function setupEventListeners() {
+            // The server-rendered show-more button, until results are first rendered here
+            document.getElementById('showMore')?.addEventListener('click', showMore);
+            
+            document.querySelectorAll('.filter-option').forEach(el => {
+                filterOptionEls.set(el.dataset.filterKey, el);
+            });
+            
+            // Search input with debounce; the term is lowercased once here
+            const runSearch = debounce((term) => {
+                currentFilters.search = term;
+                applyFilters();
+            }, 180);
+            document.getElementById('searchInput').addEventListener('input', (e) => {
+                // Echo right away, only the filter pass waits for typing to pause
+                document.getElementById('resultsDescription').textContent = 'searching…';
+                runSearch(e.target.value.toLowerCase());
+            });
+            
+            // One click handler for every card and list item, looked up by id
+            document.querySelector('.content').addEventListener('click', (e) => {
+                const item = e.target.closest('[data-id]');
+                const measure = item && measuresById.get(Number(item.dataset.id));
+                if (measure) viewMeasure(measure);
+            });
             
             // Year inputs
-            document.getElementById('yearMin').addEventListener('change', (e) => {{
+            document.getElementById('yearMin').addEventListener('change', (e) => {
                 currentFilters.yearMin = parseInt(e.target.value);
                 applyFilters();
-            }});
+            });
             
-            document.getElementById('yearMax').addEventListener('change', (e) => {{
+            document.getElementById('yearMax').addEventListener('change', (e) => {
                 currentFilters.yearMax = parseInt(e.target.value);
                 applyFilters();
-            }});
-        }}
+            });
+        }
         
         // Toggle filter
-        function toggleFilter(type, value) {{
+        function toggleFilter(type, value) {
             const index = currentFilters[type].indexOf(value);
-            if (index > -1) {{
+            if (index > -1) {
                 currentFilters[type].splice(index, 1);
-            }} else {{
+            } else {
                 currentFilters[type].push(value);
-            }}
+            }
             
             // Update UI
             updateFilterUI();
             applyFilters();
-        }}
+        }
         
         // Toggle topic
-        function toggleTopic(topic) {{
+        function toggleTopic(topic) {
             const index = currentFilters.topics.indexOf(topic);
-            if (index > -1) {{
+            if (index > -1) {
                 currentFilters.topics.splice(index, 1);
-            }} else {{
+            } else {
                 currentFilters.topics.push(topic);
-            }}
+            }
             
             // Update UI
             updateTopicUI();
             applyFilters();
-        }}
+        }
         
         // Update filter UI
-        function updateFilterUI() {{
-            document.querySelectorAll('.filter-option').forEach(el => {{
-                el.classList.remove('active');
-            }});
+        function updateFilterUI() {
+            filterOptionEls.forEach(el => el.classList.remove('active'));
             
             // Update status filters
-            currentFilters.status.forEach(status => {{
-                const el = document.querySelector(`.filter-option[onclick="toggleFilter('status', '${{status}}')"]`);
-                if (el) el.classList.add('active');
-            }});
+            currentFilters.status.forEach(status => {
+                filterOptionEls.get(`status:${status}`)?.classList.add('active');
+            });
             
             // Update feature filters
-            currentFilters.features.forEach(feature => {{
-                const el = document.querySelector(`.filter-option[onclick="toggleFilter('features', '${{feature}}')"]`);
-                if (el) el.classList.add('active');
-            }});
-        }}
+            currentFilters.features.forEach(feature => {
+                filterOptionEls.get(`features:${feature}`)?.classList.add('active');
+            });
+        }
         
         // Update topic UI
-        function updateTopicUI() {{
-            document.querySelectorAll('.topic-tag').forEach(el => {{
-                const topic = el.textContent.split(' (')[0];
-                if (currentFilters.topics.includes(topic)) {{
-                    el.classList.add('active');
-                }} else {{
-                    el.classList.remove('active');
-                }}
-            }});
-        }}
-        
-        // Apply filters
-        function applyFilters() {{
-            filteredMeasures = allMeasures.filter(measure => {{
-                // Year filter
-                const year = parseInt(measure.year);
-                if (!isNaN(year)) {{
-                    if (year < currentFilters.yearMin || year > currentFilters.yearMax) {{
-                        return false;
-                    }}
-                }}
-                
-                // Status filter
-                if (currentFilters.status.length > 0) {{
-                    const passed = measure.passed;
-                    if (currentFilters.status.includes('passed') && passed !== 1) {{
-                        if (!currentFilters.status.includes('failed') && !currentFilters.status.includes('unknown')) {{
-                            return false;
-                        }}
-                    }}
-                    if (currentFilters.status.includes('failed') && passed !== 0) {{
-                        if (!currentFilters.status.includes('passed') && !currentFilters.status.includes('unknown')) {{
-                            return false;
-                        }}
-                    }}
-                    if (currentFilters.status.includes('unknown') && (passed === 1 || passed === 0)) {{
-                        if (!currentFilters.status.includes('passed') && !currentFilters.status.includes('failed')) {{
-                            return false;
-                        }}
-                    }}
-                }}
-                
-                // Features filter
-                if (currentFilters.features.length > 0) {{
-                    if (currentFilters.features.includes('summary') && !measure.has_summary) {{
-                        return false;
-                    }}
-                    if (currentFilters.features.includes('votes') && measure.yes_votes == null) {{
-                        return false;
-                    }}
-                }}
-                
-                // Topic filter
-                if (currentFilters.topics.length > 0) {{
-                    const measureTopic = measure.topic_primary || measure.category_topic || '';
-                    if (!currentFilters.topics.includes(measureTopic)) {{
-                        return false;
-                    }}
-                }}
-                
-                // Search filter
-                if (currentFilters.search) {{
-                    const searchText = [
-                        measure.title,
-                        measure.measure_text,
-                        measure.description,
-                        measure.summary_text,
-                        measure.topic_primary,
-                        measure.year
-                    ].filter(Boolean).join(' ').toLowerCase();
-                    
-                    if (!searchText.includes(currentFilters.search)) {{
-                        return false;
-                    }}
-                }}
-                
-                return true;
-            }});
-            
-            // Apply sort
-            sortMeasures();
+        function updateTopicUI() {
+            topicTagEls.forEach((el, topic) => {
+                el.classList.toggle('active', currentFilters.topics.includes(topic));
+            });
+        }
+        
+        // Apply filters (and sort) in the worker, starting over at the first page
+        function applyFilters() {
+            resultLimit = PAGE_SIZE;
+            requestResults();
+        }
+        
+        // Ask the worker for the current page; results paint when it replies.
+        // Returns whether newly arrived records went along with the request
+        function requestResults() {
+            // Hand over records that arrived since the last request first
+            const flushed = pendingRecords.length > 0;
+            if (flushed) {
+                filterWorker.postMessage({ records: pendingRecords });
+                pendingRecords = [];
+            }
+            filterWorker.postMessage({
+                filters: currentFilters,
+                sort: currentSort,
+                limit: resultLimit,
+                seq: ++filterSeq
+            });
+            return flushed;
+        }
+        
+        // Load the next page of the results on screen
+        function showMore() {
+            // Wait for pending requests so the page extends what is shown
+            if (paintedSeq !== filterSeq) return;
+            if (filteredMeasures.length >= filteredTotal) return;
             
-            // Update UI
-            updateResults();
-        }}
-        
-        // Sort measures
-        function sortMeasures() {{
-            filteredMeasures.sort((a, b) => {{
-                switch (currentSort) {{
-                    case 'year-desc':
-                        return (b.year || 0) - (a.year || 0);
-                    case 'year-asc':
-                        return (a.year || 0) - (b.year || 0);
-                    case 'title':
-                        const titleA = a.title || a.measure_text || '';
-                        const titleB = b.title || b.measure_text || '';
-                        return titleA.localeCompare(titleB);
-                    case 'votes':
-                        return (b.total_votes || 0) - (a.total_votes || 0);
-                    default:
-                        return 0;
-                }}
-            }});
-        }}
+            // Records still streaming in can sort ahead of the rows shown, so
+            // a request that carries new ones repaints instead of appending
+            resultLimit += PAGE_SIZE;
+            if (!requestResults()) appendSeq = filterSeq;
+        }
         
         // Apply sort
-        function applySort() {{
+        function applySort() {
             currentSort = document.getElementById('sortSelect').value;
-            sortMeasures();
-            updateResults();
-        }}
+            applyFilters();
+        }
         
         // Update results display
-        function updateResults() {{
+        function updateResults() {
             // Update count
-            document.getElementById('resultsCount').textContent = filteredMeasures.length.toLocaleString();
+            document.getElementById('resultsCount').textContent = filteredTotal.toLocaleString();
             
             // Update description
             const desc = currentFilters.search ? 
-                `measures matching "${{currentFilters.search}}"` : 
+                `measures matching "${currentFilters.search}"` : 
                 'measures found';
             document.getElementById('resultsDescription').textContent = desc;
             
@@ -1133,31 +1335,46 @@ class WebsiteGenerator:
             const featuredSection = document.getElementById('featuredSection');
             if (!currentFilters.search && currentFilters.status.length === 0 && 
                 currentFilters.features.length === 0 && currentFilters.topics.length === 0 &&
-                currentFilters.yearMin === {stats.get('year_min', 1902)} && currentFilters.yearMax === {stats.get('year_max', 2026)}) {{
+                currentFilters.yearMin === INIT.yearMin &&
+                currentFilters.yearMax === INIT.yearMax) {
                 // Show featured section
                 featuredSection.style.display = 'block';
                 displayFeatured();
                 displayResults(filteredMeasures.slice(5)); // Skip featured items
-            }} else {{
+            } else {
                 // Hide featured section
                 featuredSection.style.display = 'none';
                 displayResults(filteredMeasures);
-            }}
-        }}
+            }
+        }
         
         // Display featured measures
-        function displayFeatured() {{
+        function displayFeatured() {
             const featured = filteredMeasures.slice(0, 5);
             const grid = document.getElementById('featuredGrid');
             
-            grid.innerHTML = featured.map(measure => createCard(measure, true)).join('');
-        }}
+            // Keep the server-rendered cards while they are still the right ones
+            const ids = featured.map(measure => measure.id).join(',');
+            if (grid.dataset.ids === ids) return;
+            
+            grid.dataset.ids = ids;
+            grid.replaceChildren(buildFragment(featured, measure => createCard(measure, true)));
+        }
         
         // Display results
-        function displayResults(measures) {{
+        function displayResults(measures) {
             const container = document.getElementById('resultsContainer');
             
-            if (measures.length === 0) {{
+            // Keep the server-rendered first page while it still shows these rows;
+            // lists rendered here carry no data-ids, so this only applies once
+            const rendered = document.getElementById('resultsList');
+            const ids = measures.map(m => m.id).join(',');
+            if (currentView === 'grid' && rendered && rendered.dataset.ids === ids) {
+                updateShowMore();
+                return;
+            }
+            
+            if (measures.length === 0) {
                 container.innerHTML = `
                     <div class="empty-state">
                         <div class="empty-icon">🔍</div>
@@ -1166,25 +1383,67 @@ class WebsiteGenerator:
                     </div>
                 `;
                 return;
-            }}
+            }
             
-            if (currentView === 'grid') {{
-                container.innerHTML = `
-                    <div class="results-grid">
-                        ${{measures.map(m => createCard(m)).join('')}}
-                    </div>
-                `;
-            }} else {{
-                container.innerHTML = `
-                    <div class="results-list">
-                        ${{measures.map(m => createListItem(m)).join('')}}
-                    </div>
-                `;
-            }}
-        }}
+            const list = document.createElement('div');
+            list.id = 'resultsList';
+            list.className = currentView === 'grid' ? 'results-grid' : 'results-list';
+            list.append(buildFragment(measures, rowFactory()));
+            
+            const showMoreButton = document.createElement('button');
+            showMoreButton.id = 'showMore';
+            showMoreButton.className = 'show-more';
+            showMoreButton.addEventListener('click', showMore);
+            
+            container.replaceChildren(list, showMoreButton);
+            updateShowMore();
+        }
+        
+        // Add a further page to the rendered results, leaving earlier rows alone
+        function appendResults(measures) {
+            const list = document.getElementById('resultsList');
+            if (!list) {
+                updateResults();
+                return;
+            }
+            
+            // Appended rows leave the list no longer matching the server-rendered page
+            delete list.dataset.ids;
+            list.append(buildFragment(measures, rowFactory()));
+            updateShowMore();
+        }
         
-        // Create card HTML
-        function createCard(measure, featured = false) {{
+        // Label the show-more button with what is left, watching it while rows remain
+        function updateShowMore() {
+            const button = document.getElementById('showMore');
+            const remaining = filteredTotal - filteredMeasures.length;
+            
+            moreObserver.disconnect();
+            button.hidden = remaining <= 0;
+            button.textContent = `Show more (${remaining.toLocaleString()} remaining)`;
+            if (remaining > 0) moreObserver.observe(button);
+        }
+        
+        // Row builder for the current view
+        function rowFactory() {
+            return currentView === 'grid' ? measure => createCard(measure) : createListItem;
+        }
+        
+        // Build rows off-document so they go in with a single insertion
+        function buildFragment(measures, create) {
+            const fragment = document.createDocumentFragment();
+            for (const measure of measures) {
+                fragment.appendChild(create(measure));
+            }
+            return fragment;
+        }
+        
+        // Row templates from the page; fields are filled in as text, never parsed as HTML
+        const cardTemplate = document.getElementById('cardTpl').content.firstElementChild;
+        const listItemTemplate = document.getElementById('listItemTpl').content.firstElementChild;
+        
+        // Create card element
+        function createCard(measure, featured = false) {
             const title = measure.title || measure.measure_text || 'Untitled Measure';
             const year = measure.year || 'Unknown';
             const passed = measure.passed;
@@ -1192,98 +1451,353 @@ class WebsiteGenerator:
             const passedText = passed === 1 ? 'Passed' : passed === 0 ? 'Failed' : 'Pending';
             
             const percentYes = measure.percent_yes;
-            const voteBar = percentYes != null ? `
-                <div class="vote-bar">
-                    <div class="vote-bar-fill" style="width: ${{Math.round(percentYes)}}%"></div>
-                </div>
-            ` : '';
-            
             const topic = measure.topic_primary || measure.category_topic || '';
             const source = measure.data_source || measure.source || 'Unknown';
             
-            return `
-                <div class="measure-card ${{featured ? 'featured' : ''}}" onclick="viewMeasure(${{JSON.stringify(measure).replace(/"/g, '&quot;')}})">
-                    <div class="card-header">
-                        <div class="card-year">${{year}}</div>
-                        <div class="card-badges">
-                            <span class="badge badge-${{passedClass}}">${{passedText}}</span>
-                        </div>
-                    </div>
-                    <h3 class="card-title">${{title}}</h3>
-                    ${{voteBar}}
-                    <div class="card-meta">
-                        ${{percentYes != null ? `<div class="meta-item">📊 ${{Math.round(percentYes)}}% Yes</div>` : ''}}
-                        ${{topic ? `<div class="meta-item">🏷️ ${{topic}}</div>` : ''}}
-                        <div class="meta-item">📁 ${{source}}</div>
-                    </div>
-                </div>
-            `;
-        }}
+            const card = cardTemplate.cloneNode(true);
+            card.dataset.id = measure.id;
+            if (featured) card.classList.add('featured');
+            
+            card.querySelector('.card-year').textContent = year;
+            const badge = card.querySelector('.badge');
+            badge.classList.add(`badge-${passedClass}`);
+            badge.textContent = passedText;
+            card.querySelector('.card-title').textContent = title;
+            
+            if (percentYes != null) {
+                const rounded = Math.round(percentYes);
+                card.querySelector('.vote-bar-fill').style.width = `${rounded}%`;
+                card.querySelector('.meta-percent').textContent = `📊 ${rounded}% Yes`;
+            } else {
+                card.querySelector('.vote-bar').remove();
+                card.querySelector('.meta-percent').remove();
+            }
+            
+            if (topic) {
+                card.querySelector('.meta-topic').textContent = `🏷️ ${topic}`;
+            } else {
+                card.querySelector('.meta-topic').remove();
+            }
+            card.querySelector('.meta-source').textContent = `📁 ${source}`;
+            
+            return card;
+        }
         
-        // Create list item HTML
-        function createListItem(measure) {{
+        // Create list item element
+        function createListItem(measure) {
             const title = measure.title || measure.measure_text || 'Untitled Measure';
             const year = measure.year || 'Unknown';
             const passed = measure.passed;
             const passedClass = passed === 1 ? 'passed' : passed === 0 ? 'failed' : 'pending';
             const passedText = passed === 1 ? '✓' : passed === 0 ? '✗' : '?';
             
-            return `
-                <div class="measure-list-item" onclick="viewMeasure(${{JSON.stringify(measure).replace(/"/g, '&quot;')}})">
-                    <div class="badge badge-${{passedClass}}">${{passedText}}</div>
-                    <div>
-                        <div style="font-weight: 500;">${{title}}</div>
-                        <div style="font-size: 0.875rem; color: var(--text-secondary);">
-                            ${{year}} • ${{measure.topic_primary || measure.category_topic || 'General'}}
-                        </div>
-                    </div>
-                    <div style="text-align: right;">
-                        ${{measure.percent_yes != null ? `<div style="font-weight: 500;">${{Math.round(measure.percent_yes)}}% Yes</div>` : ''}}
-                        <div style="font-size: 0.75rem; color: var(--text-tertiary);">
-                            ${{measure.data_source || measure.source || ''}}
-                        </div>
-                    </div>
-                </div>
-            `;
-        }}
+            const item = listItemTemplate.cloneNode(true);
+            item.dataset.id = measure.id;
+            
+            const badge = item.querySelector('.badge');
+            badge.classList.add(`badge-${passedClass}`);
+            badge.textContent = passedText;
+            item.querySelector('.list-title').textContent = title;
+            item.querySelector('.list-meta').textContent =
+                `${year} • ${measure.topic_primary || measure.category_topic || 'General'}`;
+            
+            if (measure.percent_yes != null) {
+                item.querySelector('.list-percent').textContent =
+                    `${Math.round(measure.percent_yes)}% Yes`;
+            } else {
+                item.querySelector('.list-percent').remove();
+            }
+            item.querySelector('.list-source').textContent =
+                measure.data_source || measure.source || '';
+            
+            return item;
+        }
         
         // View measure details
-        function viewMeasure(measure) {{
+        function viewMeasure(measure) {
             // In a real app, this would open a modal or navigate to a detail page
             console.log('View measure:', measure);
-            if (measure.pdf_url && measure.pdf_url !== '#') {{
+            if (measure.pdf_url && measure.pdf_url !== '#') {
                 window.open(measure.pdf_url, '_blank');
-            }}
-        }}
+            }
+        }
         
         // Set view mode
-        function setView(view) {{
+        function setView(view) {
             currentView = view;
             document.querySelectorAll('.view-btn').forEach(btn => btn.classList.remove('active'));
             document.getElementById(view + 'View').classList.add('active');
             displayResults(currentFilters.search || currentFilters.status.length > 0 || 
                           currentFilters.features.length > 0 || currentFilters.topics.length > 0 ? 
                           filteredMeasures : filteredMeasures.slice(5));
-        }}
+        }
         
         // Clear all filters
-        function clearAllFilters() {{
-            currentFilters = {{
-                yearMin: {stats.get('year_min', 1902)},
-                yearMax: {stats.get('year_max', 2026)},
+        function clearAllFilters() {
+            currentFilters = {
+                yearMin: INIT.yearMin,
+                yearMax: INIT.yearMax,
                 status: [],
                 features: [],
                 topics: [],
                 search: ''
-            }};
+            };
             
             // Reset UI
             document.getElementById('searchInput').value = '';
-            document.getElementById('yearMin').value = {stats.get('year_min', 1902)};
-            document.getElementById('yearMax').value = {stats.get('year_max', 2026)};
+            document.getElementById('yearMin').value = INIT.yearMin;
+            document.getElementById('yearMax').value = INIT.yearMax;
             updateFilterUI();
             updateTopicUI();
             
             applyFilters();
-        }}
-        """
\ No newline at end of file
+        }
+        """
+
+# Page template, compiled once at import
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent / 'templates')),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+    autoescape=True
+)
+_TEMPLATE = _TEMPLATE_ENV.get_template('page.html.j2')
+
+# Changes to this module or the page templates invalidate the generation stamp
+_BUILD_FINGERPRINT = hashlib.blake2b(
+    b''.join(p.read_bytes() for p in
+             [Path(__file__), *sorted(Path(_TEMPLATE.filename).parent.glob('*.j2'))]),
+    digest_size=16
+).hexdigest()
+
+# Cards rendered into the page ahead of the measures download
+_FEATURED_COUNT = 5
+
+# Rows per page of results, featured cards included; the page script reads it
+_PAGE_SIZE = 60
+
+
+class WebsiteGenerator:
+    """Generates static website from ballot measures data"""
+    
+    def __init__(self, database: Database = None, output_path: Path = None):
+        self.db = database or Database()
+        self.output_path = output_path or BASE_DIR.parent / WEBSITE_CONFIG['output_filename']
+        self.template = WEBSITE_CONFIG.get('template', 'modern')
+        self.features = WEBSITE_CONFIG.get('features', {})
+        
+    def generate(self, force: bool = False) -> Path:
+        """Generate the complete website, skipping it when inputs are unchanged"""
+        # Get data from database
+        stats = self.db.get_statistics()
+        
+        stamp = self._input_stamp(stats)
+        if (not force and self._read_stamp() == stamp and
+                all(path.exists() for path in self._output_paths())):
+            logger.info(f"Website is up to date: {self.output_path}")
+            return self.output_path
+        
+        logger.info("Generating website...")
+        
+        # Process data for website
+        measures_data = self._prepare_measures_data()
+        topics = self.db.get_top_topics(20)
+        
+        # Generate HTML straight to disk
+        output_path = self._write_html(measures_data, stats, topics)
+        WEBSITE_STAMP_PATH.write_text(stamp)
+        return output_path
+    
+    def _input_stamp(self, stats: Dict) -> str:
+        """Hash everything the generated site depends on"""
+        inputs = [stats, self.db.get_data_version(), str(self.output_path), _BUILD_FINGERPRINT]
+        return hashlib.blake2b(_encode(inputs), digest_size=16).hexdigest()
+    
+    def _output_paths(self) -> List[Path]:
+        """Every file a generation leaves behind, root copies included"""
+        paths = [self.output_path, self.output_path.with_name(_MEASURES_FILENAME)]
+        paths += [path.with_name(path.name + suffix) for path in paths for suffix in _COMPRESSORS]
+        index_path = BASE_DIR.parent / 'index.html'
+        if index_path.resolve() != self.output_path.resolve():
+            paths += [index_path.with_name(path.name) for path in paths]
+        return paths
+    
+    def _read_stamp(self) -> Optional[str]:
+        """Read the stamp left by the last generation, if any"""
+        try:
+            return WEBSITE_STAMP_PATH.read_text()
+        except FileNotFoundError:
+            return None
+    
+    def _write_html(self, measures_data: List[Dict], stats: Dict,
+                    topics: List[Dict]) -> Path:
+        """Stream the rendered page and its measures file to the output directory"""
+        # Any write, including scripts calling this directly, replaces what the
+        # stamp vouches for; generate() writes a new one once this succeeds
+        WEBSITE_STAMP_PATH.unlink(missing_ok=True)
+        
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        measures_path = self.output_path.with_name(_MEASURES_FILENAME)
+        
+        # Both files go to temporary siblings and are moved into place only once
+        # both are complete, so a failed run leaves the published (and possibly
+        # hard-linked) copies untouched
+        staged = {path: _staging_path(path) for path in (self.output_path, measures_path)}
+        try:
+            version = self._write_measures(measures_data, staged[measures_path])
+            
+            # The page asks for this exact measures file, so browsers can keep it
+            # cached across deploys until its content changes
+            measures_url = f"{_MEASURES_FILENAME}?v={version}"
+            
+            # Write chunks as they render instead of building the page in memory
+            with open(staged[self.output_path], 'wb') as f:
+                f.writelines(chunk.encode('utf-8')
+                             for chunk in self._iter_html(
+                                 stats, topics,
+                                 featured=measures_data[:_FEATURED_COUNT],
+                                 results=measures_data[_FEATURED_COUNT:_PAGE_SIZE],
+                                 total=len(measures_data),
+                                 measures_url=measures_url))
+        except BaseException:
+            for staging_path in staged.values():
+                staging_path.unlink(missing_ok=True)
+            raise
+        
+        for path, staging_path in staged.items():
+            os.replace(staging_path, path)
+        logger.info(f"Website generated: {self.output_path}")
+        logger.info(f"Saved {len(measures_data)} measures to: {measures_path}")
+        
+        # Pre-compress both files so hosts with static compression skip it per request
+        outputs = [self.output_path, measures_path]
+        outputs += [_write_compressed(path, suffix) for path in outputs for suffix in _COMPRESSORS]
+        
+        # Also save to index.html in parent directory for GitHub Pages
+        index_path = BASE_DIR.parent / 'index.html'
+        if index_path.resolve() != self.output_path.resolve():
+            for path in outputs:
+                _link_or_copy(path, index_path.with_name(path.name))
+            logger.info(f"Also saved to: {index_path}")
+        
+        return self.output_path
+    
+    def _write_measures(self, measures_data: List[Dict], path: Path) -> str:
+        """Write one JSON array per line so the browser can parse progressively,
+        returning a short hash of the content"""
+        # Rows carry values only, in header column order; repeated strings become
+        # table indexes. Column names and tables go on the first line. Rows keep
+        # the query's newest-year-first order, which the page's year filter
+        # binary-searches. Only the fields the page reads are published, however
+        # the rows were loaded
+        first = measures_data[0] if measures_data else {}
+        cols = [field for field in _WEBSITE_FIELDS if field in first]
+        tables = {field: {} for field in _INTERNED_FIELDS if field in cols}
+        interned = [(cols.index(field), table) for field, table in tables.items()]
+        records = []
+        for measure in measures_data:
+            record = [measure.get(col) for col in cols]
+            for i, table in interned:
+                if record[i] is not None:
+                    record[i] = table.setdefault(record[i], len(table))
+            records.append(record)
+        
+        header = {
+            'cols': cols,
+            'tables': {field: list(table) for field, table in tables.items()}
+        }
+        
+        lines = [_encode_line(header), *map(_encode_line, records)]
+        digest = hashlib.blake2b(digest_size=8)
+        for line in lines:
+            digest.update(line)
+        
+        with open(path, 'wb') as f:
+            f.writelines(lines)
+        
+        return digest.hexdigest()
+    
+    def _prepare_measures_data(self) -> List[Dict]:
+        """Load measures in the format needed for website"""
+        return self.db.get_measures_for_website(list(_WEBSITE_FIELDS))
+    
+    def _iter_html(self, stats: Dict, topics: List[Dict],
+                   featured: List[Dict] = (), results: List[Dict] = (), total: int = 0,
+                   measures_url: str = _MEASURES_FILENAME) -> Iterator[str]:
+        """Yield the page HTML in chunks as the template renders"""
+        # featured and results are the unfiltered view's first page, rendered
+        # here so it paints before the page script has any measures
+        ctx = self._page_context(stats, topics)
+        remaining = max(total - len(featured) - len(results), 0)
+        
+        return _TEMPLATE.generate(
+            css=self._get_css(),
+            page_data=self._get_page_data(topics, ctx, measures_url),
+            javascript=self._get_javascript(),
+            featured=[self._card_context(m) for m in featured],
+            results=[self._card_context(m) for m in results],
+            results_count='{:,}'.format(total),
+            remaining=remaining,
+            remaining_count='{:,}'.format(remaining),
+            **ctx
+        )
+    
+    def _card_context(self, measure: Dict) -> Dict:
+        """Resolve the display values createCard() would compute for a measure"""
+        passed = measure.get('passed')
+        percent_yes = measure.get('percent_yes')
+        
+        return {
+            'id': measure.get('id'),
+            'title': measure.get('title') or measure.get('measure_text') or 'Untitled Measure',
+            'year': measure.get('year') or 'Unknown',
+            'passed_class': 'passed' if passed == 1 else 'failed' if passed == 0 else 'pending',
+            'passed_text': 'Passed' if passed == 1 else 'Failed' if passed == 0 else 'Pending',
+            # Math.round() semantics, so the page matches the client-rendered cards
+            'percent_yes': math.floor(percent_yes + 0.5) if percent_yes is not None else None,
+            'topic': measure.get('topic_primary') or measure.get('category_topic') or '',
+            'source': measure.get('data_source') or measure.get('source') or 'Unknown'
+        }
+    
+    def _page_context(self, stats: Dict, topics: List[Dict]) -> Dict:
+        """Resolve every value the page shows once, so the template only substitutes"""
+        year_min = stats.get('year_min', 1902)
+        year_max = stats.get('year_max', 2026)
+        total_with_outcome = stats['passed'] + stats['failed']
+        pass_rate = (round(stats['passed'] / total_with_outcome * 100)
+                     if total_with_outcome > 0 else 0)
+        
+        return {
+            'year_min': year_min,
+            'year_max': year_max,
+            'years_covered': year_max - year_min,
+            'total_measures': '{:,}'.format(stats['total_measures']),
+            'passed': stats['passed'],
+            'failed': stats['failed'],
+            'unknown_count': stats['unknown_outcome'],
+            'with_summaries': stats['with_summaries'],
+            'with_votes': stats['with_votes'],
+            'pass_rate': pass_rate,
+            'topic_count': len(topics),
+            'updated': datetime.now().strftime('%B %d, %Y')
+        }
+    
+    def _get_css(self) -> str:
+        """Get CSS styles for the website"""
+        return _CSS_STATIC
+    
+    def _get_page_data(self, topics: List[Dict], ctx: Dict, measures_url: str) -> str:
+        """Get the JSON the page script reads from its #pageData block"""
+        return _script_json({
+            'topics': topics,
+            'init': {
+                'yearMin': ctx['year_min'],
+                'yearMax': ctx['year_max'],
+                'measuresUrl': measures_url,
+                'pageSize': _PAGE_SIZE
+            }
+        })
+    
+    def _get_javascript(self) -> str:
+        """Get JavaScript code for the website"""
+        return _JS_STATIC
@@ -0,0 +1,57 @@
+"""
+Tests for the NCSL parser
+"""
+import pandas as pd
+import pytest
+
+from src.parsers import ncsl
+from src.parsers.ncsl import NCSLParser, NCSL_CACHE_FILENAME, NCSL_FILENAME, _classify_outcomes
+
+
+def test_classify_outcomes():
+    outcomes = _classify_outcomes(pd.Series(['62.5', 41, None, 'n/a', 50.0], index=list('abcde')))
+
+    assert list(outcomes.index) == list('abcde')
+    assert outcomes['_passed'].tolist() == [1, 0, -1, -1, 0]
+    assert outcomes['_pass_fail'].isna().tolist() == [False, False, True, True, False]
+    assert outcomes['_pass_fail'].dropna().tolist() == ['Pass', 'Fail', 'Fail']
+    assert outcomes['_percent_yes'].tolist()[:2] == [62.5, 41.0]
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """A small NCSL workbook with California and other states' rows"""
+    path = tmp_path / 'raw' / NCSL_FILENAME
+    path.parent.mkdir()
+    pd.DataFrame({
+        'StateName': ['California', 'Oregon', 'California', 'California'],
+        'Year': [2016, 2016, 2020, 2010],
+        'ID': ['CA-1', 'OR-1', 'CA-2', 'CA-3'],
+        'Title': ['Prop 64', 'Measure 97', 'Prop 22', 'Too Early'],
+        'Summary': ['Marijuana legalization', 'Corporate tax', None, 'Out of range'],
+        'IRTypeDefinition': ['Initiative'] * 4,
+        'TOPICDESCRIPTION': ['Drugs', 'Taxes', 'Labor', 'Other'],
+        'IRStatusDefinition': ['Approved', 'Defeated', 'Approved', 'Approved'],
+        'ElectionType': ['General'] * 4,
+        'PercentageVote': [57.1, 41.0, None, 60.0],
+        'Notes': ['not read'] * 4,
+    }).to_excel(path, index=False)
+    return path
+
+
+def test_parse_reads_california_rows(workbook, tmp_path):
+    measures = NCSLParser(tmp_path).parse()
+
+    assert [m['measure_id'] for m in measures] == ['CA-1', 'CA-2']
+    assert measures[0]['passed'] == 1
+    assert measures[0]['pass_fail'] == 'Pass'
+    assert 'passed' not in measures[1]
+
+
+@pytest.mark.skipif(ncsl.pq is None, reason='pyarrow is not installed')
+def test_parquet_cache_matches_workbook(workbook, tmp_path, monkeypatch):
+    cached = NCSLParser(tmp_path).parse()
+    assert (workbook.parent / NCSL_CACHE_FILENAME).exists()
+
+    monkeypatch.setattr(ncsl, 'pq', None)
+    assert NCSLParser(tmp_path).parse() == cached
@@ -0,0 +1,91 @@
+"""
+Tests for the shared scraper HTTP handling
+"""
+import pytest
+import requests
+
+from src.config import SCRAPING_CONFIG
+from src.scrapers import base
+from src.scrapers.base import BaseScraper
+
+URL = 'https://example.com/measures'
+
+
+class StubScraper(BaseScraper):
+    """Scraper with nothing to scrape, for exercising BaseScraper"""
+
+    def scrape(self):
+        return []
+
+
+def _response(status_code: int, body: str = '', **headers) -> requests.Response:
+    """A canned response as the session would return it"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body.encode()
+    response.encoding = 'utf-8'
+    response.url = URL
+    response.headers.update(headers)
+    return response
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """A scraper with its HTTP cache in tmp_path and canned responses"""
+    monkeypatch.setattr(base, 'HTTP_CACHE_DIR', tmp_path)
+    monkeypatch.setitem(SCRAPING_CONFIG, 'http_cache', True)
+    monkeypatch.setitem(SCRAPING_CONFIG, 'rate_limit', 0)
+
+    stub = StubScraper('test')
+    stub.responses = []
+    stub.requests = []
+
+    def get(url, **kwargs):
+        stub.requests.append(kwargs.get('headers') or {})
+        return stub.responses.pop(0)
+
+    monkeypatch.setattr(stub.session, 'get', get)
+    return stub
+
+
+def test_not_modified_returns_cached_body(scraper):
+    scraper.responses = [
+        _response(200, '<p>measures</p>', ETag='"v1"', **{'Last-Modified': 'Tue, 01 Oct 2024'}),
+        _response(304)
+    ]
+
+    assert scraper._fetch_page(URL) == '<p>measures</p>'
+    assert scraper._fetch_page(URL) == '<p>measures</p>'
+
+    # The second request revalidates with the stored validators
+    assert 'If-None-Match' not in scraper.requests[0]
+    assert scraper.requests[1]['If-None-Match'] == '"v1"'
+    assert scraper.requests[1]['If-Modified-Since'] == 'Tue, 01 Oct 2024'
+
+
+def test_modified_page_replaces_cached_body(scraper):
+    scraper.responses = [
+        _response(200, 'old', ETag='"v1"'),
+        _response(200, 'new', ETag='"v2"'),
+        _response(304)
+    ]
+
+    assert [scraper._fetch_page(URL) for _ in range(3)] == ['old', 'new', 'new']
+    assert scraper.requests[2]['If-None-Match'] == '"v2"'
+
+
+def test_response_without_validators_is_not_cached(scraper):
+    scraper.responses = [_response(200, 'body'), _response(200, 'body')]
+
+    scraper._fetch_page(URL)
+    scraper._fetch_page(URL)
+
+    assert not scraper._cache_path(URL).exists()
+    assert scraper.requests[1] == {}
+
+
+def test_failed_request_returns_none(scraper):
+    scraper.responses = [_response(404)]
+
+    assert scraper._fetch_page(URL) is None
+    assert not scraper._cache_path(URL).exists()
@@ -0,0 +1,139 @@
+"""
+Tests for static website generation
+"""
+import json
+
+import pytest
+
+from src.database.models import BallotMeasure
+from src.database.operations import Database
+from src.website import generator as website
+from src.website.generator import WebsiteGenerator, _WEBSITE_FIELDS
+
+
+def _measure(n: int, **fields) -> BallotMeasure:
+    """A minimal active measure with unique fingerprints"""
+    return BallotMeasure(
+        fingerprint=f"fp{n}",
+        measure_fingerprint=f"mfp{n}",
+        content_hash=f"hash{n}",
+        **fields
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A fresh database holding a few measures"""
+    database = Database(tmp_path / 'test.db')
+    database.insert_measure(_measure(1, year=2024, title='Housing Bond', passed=True,
+                                     percent_yes=55.2, yes_votes=1200, total_votes=2174,
+                                     topic_primary='Housing', data_source='CA SOS'))
+    database.insert_measure(_measure(2, year=2022, title='Parcel Tax', passed=False,
+                                     percent_yes=41.0, topic_primary='Taxes',
+                                     data_source='NCSL'))
+    database.insert_measure(_measure(3, year=1998, title='Library Bond', topic_primary='Housing'))
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch, db):
+    """A generator writing into tmp_path, with its stamp kept there too"""
+    (tmp_path / 'scraper').mkdir()
+    monkeypatch.setattr(website, 'BASE_DIR', tmp_path / 'scraper')
+    monkeypatch.setattr(website, 'WEBSITE_STAMP_PATH', tmp_path / 'website.stamp')
+
+    generator = WebsiteGenerator(db, output_path=tmp_path / 'index.html')
+    generator.writes = 0
+    write_html = generator._write_html
+
+    def counting_write_html(*args):
+        generator.writes += 1
+        return write_html(*args)
+
+    monkeypatch.setattr(generator, '_write_html', counting_write_html)
+    return generator
+
+
+def test_generate_skips_unchanged_inputs(site):
+    site.generate()
+    site.generate()
+
+    assert site.writes == 1
+    assert all(path.exists() for path in site._output_paths())
+
+
+def test_force_regenerates(site):
+    site.generate()
+    site.generate(force=True)
+
+    assert site.writes == 2
+
+
+def test_new_measure_invalidates_stamp(site, db):
+    site.generate()
+    db.insert_measure(_measure(4, year=2020, title='School Bond'))
+    site.generate()
+
+    assert site.writes == 2
+
+
+def test_missing_output_invalidates_stamp(site, tmp_path):
+    site.generate()
+    (tmp_path / 'measures.ndjson.gz').unlink()
+    site.generate()
+
+    assert site.writes == 2
+    assert (tmp_path / 'measures.ndjson.gz').exists()
+
+
+def test_direct_write_invalidates_stamp(site, db, tmp_path):
+    site.generate()
+
+    # Any other write to the outputs, such as scripts/generate_site.py, drops the stamp
+    other = WebsiteGenerator(db, output_path=tmp_path / 'index.html')
+    other._write_html(other._prepare_measures_data(), db.get_statistics(), [])
+    assert not website.WEBSITE_STAMP_PATH.exists()
+
+    site.generate()
+    assert site.writes == 2
+
+
+def test_write_measures_round_trip(db, tmp_path):
+    generator = WebsiteGenerator(db, output_path=tmp_path / 'index.html')
+    measures = generator._prepare_measures_data()
+    path = tmp_path / 'measures.ndjson'
+
+    digest = generator._write_measures(measures, path)
+    header, *rows = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert header['cols'] == [field for field in _WEBSITE_FIELDS if field in measures[0]]
+    decoded = []
+    for row in rows:
+        record = dict(zip(header['cols'], row))
+        for field, table in header['tables'].items():
+            if record[field] is not None:
+                record[field] = table[record[field]]
+        decoded.append(record)
+    assert decoded == measures
+
+    # The digest only depends on the content written
+    assert generator._write_measures(measures, tmp_path / 'again.ndjson') == digest
+    assert generator._write_measures(measures[:1], tmp_path / 'one.ndjson') != digest
+
+
+def test_write_measures_without_rows(db, tmp_path):
+    generator = WebsiteGenerator(db, output_path=tmp_path / 'index.html')
+    path = tmp_path / 'measures.ndjson'
+    generator._write_measures([], path)
+
+    assert json.loads(path.read_text()) == {'cols': [], 'tables': {}}
+
+
+def test_page_data_escapes_markup(site):
+    topics = [{'topic': 'x<!--<script>', 'count': 1}]
+    page = ''.join(site._iter_html(site.db.get_statistics(), topics))
+    page_data = page.split('id="pageData">', 1)[1].split('</script>', 1)[0]
+
+    assert '<' not in page_data
+    assert json.loads(page_data)['topics'] == topics